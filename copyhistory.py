@@ -1,6 +1,8 @@
 import argparse
 import sys
+import threading
 import time
+from concurrent.futures import Future
 from datetime import datetime
 from typing import List, Optional
 
@@ -14,31 +16,111 @@ from copyhistory_core import (
     get_all_clips,
     delete_all_clips,
 )
+from copyhistory_clipboard import (
+    ClipboardListener,
+    paste_text,
+    read_clipboard_text,
+    read_initial_clipboard,
+)
 
 
-def monitor_clipboard(poll_interval: float = 0.4) -> None:
-    print("Monitoring clipboard. Press Ctrl+C to stop.")
-    last_value = None
-    initialized = False
+def _capture(current: str) -> None:
+    # Don't wait for the write: in listener mode this runs inside the window
+    # procedure, and blocking there stalls the message loop
+    add_clip(current).add_done_callback(_report_capture)
+
+
+def _report_capture(future: "Future[int]") -> None:
+    """Print the outcome of a queued capture. Runs on the writer thread."""
     try:
-        while True:
+        item_id = future.result()
+    except Exception as exc:
+        print(f"Error saving clip: {exc}", file=sys.stderr)
+        return
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] Captured new item id={item_id}")
+
+
+def _listen_clipboard() -> bool:
+    """
+    Capture clipboard changes via Win32 change notifications.
+
+    Returns False without capturing anything if notifications are unavailable.
+    """
+    last_value: Optional[str] = None
+
+    def on_change() -> None:
+        nonlocal last_value
+        try:
+            current = read_clipboard_text()
+        except OSError as exc:
+            print(f"Error reading clipboard: {exc}", file=sys.stderr)
+            return
+        if current and current != last_value:
+            last_value = current
+            _capture(current)
+
+    listener = ClipboardListener(on_change)
+    started = threading.Event()
+    ok = False
+
+    def pump() -> None:
+        nonlocal ok, last_value
+        ok = listener.start()
+        if ok:
+            # Ignore whatever was already on the clipboard when monitoring started
             try:
-                current = pyperclip.paste()
-            except Exception as exc:
-                print(f"Error reading clipboard: {exc}", file=sys.stderr)
-                time.sleep(poll_interval)
-                continue
-
-            if not initialized:
-                # Ignore whatever was already on the clipboard when monitoring started
-                last_value = current if isinstance(current, str) else None
-                initialized = True
-            elif current and isinstance(current, str) and current != last_value:
-                last_value = current
-                item_id = add_clip(current)
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Captured new item id={item_id}")
+                last_value = read_clipboard_text()
+            except OSError:
+                last_value = None
+        started.set()
+        if ok:
+            listener.run()
+
+    # The message loop blocks in GetMessage, which Ctrl+C cannot interrupt,
+    # so pump it on a helper thread and keep the main thread interruptible.
+    pump_thread = threading.Thread(target=pump, daemon=True)
+    pump_thread.start()
+    started.wait()
+    if not ok:
+        return False
+
+    try:
+        while pump_thread.is_alive():
+            time.sleep(1.0)
+    finally:
+        listener.stop()
+    return True
+
 
+def _report_read_error(exc: Exception) -> None:
+    print(f"Error reading clipboard: {exc}", file=sys.stderr)
+
+
+def _poll_clipboard(poll_interval: float) -> None:
+    # Ignore whatever was already on the clipboard when monitoring started
+    last_value = read_initial_clipboard(poll_interval, on_error=_report_read_error)
+
+    while True:
+        try:
+            current = paste_text()
+        except Exception as exc:
+            _report_read_error(exc)
             time.sleep(poll_interval)
+            continue
+
+        if current and current != last_value:
+            last_value = current
+            _capture(current)
+
+        time.sleep(poll_interval)
+
+
+def monitor_clipboard(poll_interval: float = 0.4) -> None:
+    print("Monitoring clipboard. Press Ctrl+C to stop.")
+    try:
+        # Polling is only the fallback when change notifications are unavailable
+        if not _listen_clipboard():
+            _poll_clipboard(poll_interval)
     except KeyboardInterrupt:
         print("\nStopped monitoring.")
 
@@ -48,7 +130,7 @@ def cmd_monitor(args: argparse.Namespace) -> None:
 
 
 def cmd_list(args: argparse.Namespace) -> None:
-    clips = fetch_clips(limit=args.limit, search=args.search)
+    clips = fetch_clips(limit=args.limit, search=args.search, with_content=False)
     if not clips:
         print("No clipboard history yet.")
         return
@@ -56,7 +138,7 @@ def cmd_list(args: argparse.Namespace) -> None:
     for item in clips:
         title = item.title or "(no title yet)"
         category = item.category or "-"
-        preview = item.content.replace("\n", " ")
+        preview = item.preview
         if len(preview) > 80:
             preview = preview[:77] + "..."
         print(f"[{item.id}] {item.created_at} | {category} | {title}")
@@ -90,7 +172,10 @@ def build_arg_parser() -> argparse.ArgumentParser:
         "--interval",
         type=float,
         default=0.4,
-        help="Polling interval in seconds (default: 0.4).",
+        help=(
+            "Polling interval in seconds, used only when clipboard change "
+            "notifications are unavailable (default: 0.4)."
+        ),
     )
     monitor_parser.set_defaults(func=cmd_monitor)
 
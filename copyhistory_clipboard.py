@@ -0,0 +1,259 @@
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import pyperclip
+
+# Native Win32 clipboard access. Everything here degrades gracefully on
+# non-Windows platforms: ``ClipboardListener.start`` returns False and callers
+# fall back to polling via pyperclip.
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    LRESULT = ctypes.c_ssize_t
+    WNDPROC = ctypes.WINFUNCTYPE(
+        LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+    )
+
+    class WNDCLASSEXW(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.UINT),
+            ("style", wintypes.UINT),
+            ("lpfnWndProc", WNDPROC),
+            ("cbClsExtra", ctypes.c_int),
+            ("cbWndExtra", ctypes.c_int),
+            ("hInstance", wintypes.HINSTANCE),
+            ("hIcon", wintypes.HICON),
+            ("hCursor", wintypes.HANDLE),
+            ("hbrBackground", wintypes.HBRUSH),
+            ("lpszMenuName", wintypes.LPCWSTR),
+            ("lpszClassName", wintypes.LPCWSTR),
+            ("hIconSm", wintypes.HICON),
+        ]
+
+    user32.DefWindowProcW.argtypes = [
+        wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+    ]
+    user32.DefWindowProcW.restype = LRESULT
+    user32.RegisterClassExW.argtypes = [ctypes.POINTER(WNDCLASSEXW)]
+    user32.RegisterClassExW.restype = wintypes.ATOM
+    user32.CreateWindowExW.argtypes = [
+        wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+    ]
+    user32.CreateWindowExW.restype = wintypes.HWND
+    user32.DestroyWindow.argtypes = [wintypes.HWND]
+    user32.AddClipboardFormatListener.argtypes = [wintypes.HWND]
+    user32.AddClipboardFormatListener.restype = wintypes.BOOL
+    user32.RemoveClipboardFormatListener.argtypes = [wintypes.HWND]
+    user32.RemoveClipboardFormatListener.restype = wintypes.BOOL
+    user32.GetMessageW.argtypes = [
+        ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT
+    ]
+    user32.GetMessageW.restype = wintypes.BOOL
+    user32.TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+    user32.DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+    user32.DispatchMessageW.restype = LRESULT
+    user32.PostMessageW.argtypes = [
+        wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+    ]
+    user32.PostMessageW.restype = wintypes.BOOL
+    user32.IsClipboardFormatAvailable.argtypes = [wintypes.UINT]
+    user32.IsClipboardFormatAvailable.restype = wintypes.BOOL
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.CloseClipboard.restype = wintypes.BOOL
+    user32.GetClipboardData.argtypes = [wintypes.UINT]
+    user32.GetClipboardData.restype = wintypes.HANDLE
+    kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+    kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalUnlock.restype = wintypes.BOOL
+
+CF_UNICODETEXT = 13
+WM_CLOSE = 0x0010
+WM_DESTROY = 0x0002
+WM_CLIPBOARDUPDATE = 0x031D
+HWND_MESSAGE = -3
+
+_WINDOW_CLASS = "ClipVaultClipboardListener"
+
+
+def clipboard_has_text() -> bool:
+    """
+    Cheaply check whether the clipboard holds text, without opening it.
+
+    Always True where the check is unavailable, so callers simply read.
+    """
+    if sys.platform != "win32":
+        return True
+    return bool(user32.IsClipboardFormatAvailable(CF_UNICODETEXT))
+
+
+def paste_text() -> Optional[str]:
+    """Read the clipboard through pyperclip; None unless it holds text."""
+    # Skip the paste entirely for non-text clipboard formats
+    if not clipboard_has_text():
+        return None
+    value = pyperclip.paste()
+    return value if isinstance(value, str) else None
+
+
+def read_initial_clipboard(
+    retry_interval: float,
+    stop_event: Optional[threading.Event] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> Optional[str]:
+    """
+    Return the clipboard text present when a polling monitor starts.
+
+    Pollers compare against it so that text which was already on the
+    clipboard is not captured. Failed reads are passed to ``on_error`` and
+    retried every ``retry_interval`` seconds; None is returned if
+    ``stop_event`` is set first.
+    """
+    while stop_event is None or not stop_event.is_set():
+        try:
+            return paste_text()
+        except Exception as exc:
+            if on_error is not None:
+                on_error(exc)
+            time.sleep(retry_interval)
+    return None
+
+
+def read_clipboard_text(retries: int = 5) -> Optional[str]:
+    """
+    Read CF_UNICODETEXT straight from the Win32 clipboard.
+
+    Returns None when the clipboard holds no text. Raises OSError if the
+    clipboard stays locked by another process for all retries.
+    """
+    if not clipboard_has_text():
+        # Images, file lists etc.: nothing to open or decode
+        return None
+
+    # The copying application often still has the clipboard open when the
+    # change notification arrives, so retry briefly before giving up.
+    for _ in range(retries):
+        if user32.OpenClipboard(None):
+            break
+        time.sleep(0.01)
+    else:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        handle = user32.GetClipboardData(CF_UNICODETEXT)
+        if not handle:
+            return None
+        ptr = kernel32.GlobalLock(handle)
+        if not ptr:
+            return None
+        try:
+            return ctypes.wstring_at(ptr)
+        finally:
+            kernel32.GlobalUnlock(handle)
+    finally:
+        user32.CloseClipboard()
+
+
+class ClipboardListener:
+    """
+    Hidden message-only window that receives WM_CLIPBOARDUPDATE notifications.
+
+    ``start`` and ``run`` must be called from the same thread, since the window
+    belongs to the thread that created it. ``stop`` may be called from any
+    thread.
+    """
+
+    def __init__(self, on_change: Callable[[], None]) -> None:
+        self._on_change = on_change
+        self._hwnd = None
+
+    def start(self) -> bool:
+        """Create the window and join the clipboard listener chain."""
+        if sys.platform != "win32" or not _register_window_class():
+            return False
+
+        hwnd = user32.CreateWindowExW(
+            0, _WINDOW_CLASS, "ClipVault", 0, 0, 0, 0, 0,
+            HWND_MESSAGE, None, kernel32.GetModuleHandleW(None), None,
+        )
+        if not hwnd:
+            return False
+
+        _listeners[hwnd] = self
+        if not user32.AddClipboardFormatListener(hwnd):
+            _listeners.pop(hwnd, None)
+            user32.DestroyWindow(hwnd)
+            return False
+
+        self._hwnd = hwnd
+        return True
+
+    def run(self) -> None:
+        """Pump window messages until ``stop`` is called."""
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+    def stop(self) -> None:
+        """Ask the listener window to close, which ends ``run``."""
+        if self._hwnd is not None:
+            user32.PostMessageW(self._hwnd, WM_CLOSE, 0, 0)
+
+    def _window_proc(self, hwnd, msg, wparam, lparam):
+        if msg == WM_CLIPBOARDUPDATE:
+            try:
+                self._on_change()
+            except Exception:
+                # Never let a callback error escape into the Win32 message loop
+                pass
+            return 0
+        if msg == WM_DESTROY:
+            user32.RemoveClipboardFormatListener(hwnd)
+            _listeners.pop(hwnd, None)
+            self._hwnd = None
+            user32.PostQuitMessage(0)
+            return 0
+        return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+
+# The window class has a single WNDPROC; it forwards messages to the
+# listener that owns the receiving window.
+_listeners: Dict[int, ClipboardListener] = {}
+_class_wndproc = None
+
+
+def _class_window_proc(hwnd, msg, wparam, lparam):
+    listener = _listeners.get(hwnd)
+    if listener is not None:
+        return listener._window_proc(hwnd, msg, wparam, lparam)
+    return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+
+def _register_window_class() -> bool:
+    global _class_wndproc
+    if _class_wndproc is not None:
+        return True
+
+    wndproc = WNDPROC(_class_window_proc)
+    wc = WNDCLASSEXW()
+    wc.cbSize = ctypes.sizeof(WNDCLASSEXW)
+    wc.lpfnWndProc = wndproc
+    wc.hInstance = kernel32.GetModuleHandleW(None)
+    wc.lpszClassName = _WINDOW_CLASS
+    if not user32.RegisterClassExW(ctypes.byref(wc)):
+        return False
+    # Keep the callback alive for as long as the class is registered
+    _class_wndproc = wndproc
+    return True
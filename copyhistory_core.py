@@ -1,13 +1,32 @@
+import atexit
+import functools
+import hashlib
 import os
+import queue
 import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-# Load environment variables from .env.local or .env if present
-try:
-    from dotenv import load_dotenv
+_env_loaded = False
+
+
+def _ensure_env_loaded() -> None:
+    """Load environment variables from .env.local or .env once, if present."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        # If python-dotenv is not installed, we simply skip file-based env loading.
+        return
 
     # In dev, .env files can sit next to this module; in a bundled exe,
     # this is best-effort and safe to ignore if not found.
@@ -15,9 +34,13 @@ try:
         env_path = Path(__file__).with_name(env_name)
         if env_path.exists():
             load_dotenv(env_path, override=False)
+
+
+try:
+    import zstandard
 except ImportError:
-    # If python-dotenv is not installed, we simply skip file-based env loading.
-    pass
+    # Without zstandard, new clips are stored uncompressed.
+    zstandard = None
 
 
 def _resolve_db_file() -> str:
@@ -30,6 +53,7 @@ def _resolve_db_file() -> str:
       3. %APPDATA%\ClipVault\history.db
       4. ~/ClipVault/history.db as a last resort
     """
+    _ensure_env_loaded()
     custom = os.getenv("CLIPVAULT_DB_PATH")
     if custom:
         db_path = Path(custom)
@@ -46,20 +70,130 @@ def _resolve_db_file() -> str:
     return str(app_dir / "history.db")
 
 
-DB_FILE = _resolve_db_file()
+_db_file: Optional[str] = None
+
+
+def _get_db_file() -> str:
+    """Resolve the database path on first use rather than at import time."""
+    global _db_file
+    if _db_file is None:
+        _db_file = _resolve_db_file()
+    return _db_file
+
+
+def __getattr__(name: str):
+    # Keep ``copyhistory_core.DB_FILE`` working without resolving it on import
+    if name == "DB_FILE":
+        return _get_db_file()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClipItem:
+    # Built from query rows by _clip_from_row
     id: int
     created_at: str
     title: Optional[str]
     category: Optional[str]
-    content: str
+    # None when fetched with fetch_clips(with_content=False)
+    content: Optional[str]
+    # Filled in by fetch_clips for list views: single-line start of content
+    # and the local calendar date (YYYY-MM-DD) the clip was captured on
+    preview: Optional[str] = None
+    local_date: Optional[str] = None
+
+    @property
+    def local_date_str(self) -> str:
+        """Local capture date (YYYY-MM-DD), parsed at most once per timestamp."""
+        return self.local_date or _local_date_of(self.created_at)
+
+
+@functools.lru_cache(maxsize=1024)
+def _local_date_of(created_at: Optional[str]) -> str:
+    # ClipItem is frozen and slotted, so the parse is memoized per timestamp
+    # string here rather than on the instance.
+    if not created_at:
+        return "Unknown date"
+    try:
+        ts = created_at.strip()
+        if ts.endswith("Z"):
+            ts = ts[:-1] + "+00:00"
+        return datetime.fromisoformat(ts).astimezone().date().isoformat()
+    except ValueError:
+        # Fallback: just take the date part if present
+        return created_at.split("T", 1)[0] or "Unknown date"
+
+
+# Number of read-only connections kept open alongside the single writer
+_READ_POOL_SIZE = 3
+
+_init_lock = threading.Lock()
+_write_lock = threading.Lock()
+_write_conn: Optional[sqlite3.Connection] = None
+_read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+# False if this SQLite build lacks FTS5; search then falls back to LIKE
+_fts_enabled = False
+
+# add_clip hands rows to a background writer, which commits up to
+# _WRITE_BATCH_SIZE of them per transaction, waiting at most
+# _WRITE_BATCH_DELAY seconds for a batch to fill
+_WRITE_BATCH_SIZE = 64
+_WRITE_BATCH_DELAY = 0.2
+_write_queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=1024)
+_writer_thread: Optional[threading.Thread] = None
+
+# (formatted timestamp, epoch second it was formatted for)
+_cached_iso_ts: "tuple[str, int]" = ("", -1)
+
+# delete_all_clips drops and recreates the tables above this many rows
+_DROP_TABLE_THRESHOLD = 10_000
 
+# Clips at least this long are stored zstd-compressed in content_blob
+_COMPRESS_MIN_CHARS = 256
+_compressor = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
 
-def get_db_connection():
-    conn = sqlite3.connect(DB_FILE)
+# Select list shared by all clip queries. Compressed clips come back with an
+# empty content and their text in content_blob; _clip_from_row decompresses
+# them in Python, so no stored SQL depends on an app-defined function and
+# other SQLite clients can still read and write the database.
+_CLIP_COLUMNS = "id, created_at, title, category, content, content_blob"
+
+# Content, title and category in one expression, so the LIKE search fallback
+# (used only without FTS5) scans each row once instead of three times. LIKE is
+# already case-insensitive for ASCII, so no lower() is applied.
+_SEARCHABLE_EXPR = (
+    "clip_text(content, content_blob) || char(10) || "
+    "coalesce(title, '') || char(10) || coalesce(category, '')"
+)
+
+# fetch_clips also returns the first _PREVIEW_CHARS characters with newlines
+# flattened, and the local capture date, so list views never have to scan
+# full clip bodies or parse timestamps. For compressed clips the SQL preview
+# is empty and _clip_from_row builds it from the decompressed text instead.
+_PREVIEW_CHARS = 160
+_LIST_EXTRAS = (
+    f"substr(replace(content, char(10), ' '), 1, {_PREVIEW_CHARS}), "
+    "date(created_at, 'localtime')"
+)
+_CLIP_LIST_COLUMNS = f"{_CLIP_COLUMNS}, {_LIST_EXTRAS}"
+# fetch_clips(with_content=False) leaves out content; compressed clips are
+# only decompressed as far as their preview needs
+_CLIP_SUMMARY_COLUMNS = f"id, created_at, title, category, content_blob, {_LIST_EXTRAS}"
+
+
+def _init_schema(conn: sqlite3.Connection) -> None:
+    # Only takes effect when the database file is new (or after a VACUUM)
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")
+    _create_schema(conn)
+    conn.commit()
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    """Create or upgrade tables and indexes without committing."""
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS clipboard_history (
@@ -67,121 +201,608 @@ def get_db_connection():
             created_at TEXT NOT NULL,
             content TEXT NOT NULL,
             title TEXT,
-            category TEXT
+            category TEXT,
+            content_sha1 BLOB,
+            content_blob BLOB,
+            recency INTEGER
         )
         """
     )
-    return conn
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(clipboard_history)")}
+    if "content_blob" not in columns:
+        conn.execute("ALTER TABLE clipboard_history ADD COLUMN content_blob BLOB")
+    _ensure_content_hashes(conn)
+    _ensure_recency(conn)
+    _init_fts(conn)
+
+
+def _clip_text(content: str, content_blob: Optional[bytes]) -> str:
+    """Return a clip's full text, decompressing it if it was stored compressed."""
+    if content_blob is None:
+        return content
+    if zstandard is None:
+        raise RuntimeError("The zstandard package is required to read compressed clips.")
+    return zstandard.ZstdDecompressor().decompress(content_blob).decode("utf-8")
+
+
+def _encode_content(content: str) -> "tuple[str, Optional[bytes]]":
+    """Split content into the (content, content_blob) pair that gets stored."""
+    if _compressor is None or len(content) < _COMPRESS_MIN_CHARS:
+        return content, None
+    blob = _compressor.compress(content.encode("utf-8"))
+    if len(blob) >= len(content):
+        return content, None
+    return "", blob
+
+
+def _clip_from_row(row: tuple) -> ClipItem:
+    """Build a ClipItem from a _CLIP_COLUMNS (or _CLIP_LIST_COLUMNS) row."""
+    item_id, created_at, title, category, content, content_blob, *extra = row
+    text = _clip_text(content, content_blob)
+    if not extra:
+        return ClipItem(item_id, created_at, title, category, text)
+    preview, local_date = extra
+    if content_blob is not None:
+        preview = text[:_PREVIEW_CHARS].replace("\n", " ")
+    return ClipItem(item_id, created_at, title, category, text, preview, local_date)
+
+
+def _summary_from_row(row: tuple) -> ClipItem:
+    """Build a content-less ClipItem from a _CLIP_SUMMARY_COLUMNS row."""
+    item_id, created_at, title, category, content_blob, preview, local_date = row
+    if content_blob is not None:
+        if zstandard is None:
+            raise RuntimeError(
+                "The zstandard package is required to read compressed clips."
+            )
+        # UTF-8 needs at most 4 bytes per character; a character cut off at
+        # the end is dropped
+        with zstandard.ZstdDecompressor().stream_reader(content_blob) as reader:
+            head = reader.read(_PREVIEW_CHARS * 4).decode("utf-8", errors="ignore")
+        preview = head[:_PREVIEW_CHARS].replace("\n", " ")
+    return ClipItem(item_id, created_at, title, category, None, preview, local_date)
+
+
+def _register_functions(conn: sqlite3.Connection) -> None:
+    # For query-time SQL issued by this module only; never used in the schema
+    conn.create_function("clip_text", 2, _clip_text, deterministic=True)
+
+
+def _content_sha1(content: str) -> bytes:
+    return hashlib.sha1(content.encode("utf-8")).digest()
+
 
+def _ensure_content_hashes(conn: sqlite3.Connection) -> None:
+    """Add and back-fill the content hash used to collapse duplicate clips."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(clipboard_history)")}
+    if "content_sha1" not in columns:
+        conn.execute("ALTER TABLE clipboard_history ADD COLUMN content_sha1 BLOB")
+    conn.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_content_sha1
+        ON clipboard_history(content_sha1)
+        """
+    )
+    if "content_sha1" in columns:
+        return
+
+    # Hash newest rows first so the most recent copy of a duplicate keeps the
+    # hash; older duplicates are left unhashed rather than deleted.
+    rows = conn.execute(
+        """
+        SELECT id, clip_text(content, content_blob)
+        FROM clipboard_history
+        ORDER BY id DESC
+        """
+    ).fetchall()
+    for item_id, content in rows:
+        conn.execute(
+            "UPDATE OR IGNORE clipboard_history SET content_sha1 = ? WHERE id = ?",
+            (_content_sha1(content), item_id),
+        )
+
+
+def _ensure_recency(conn: sqlite3.Connection) -> None:
+    """
+    Add, back-fill and index the recency key that listings sort by.
+
+    created_at only has second precision, so copying A, B and A again
+    within one second would leave A listed below B. recency instead takes
+    the next value of a counter whenever a clip is stored or bumped.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(clipboard_history)")}
+    if "recency" not in columns:
+        conn.execute("ALTER TABLE clipboard_history ADD COLUMN recency INTEGER")
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'ix_recency'"
+    ).fetchone()
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS ix_recency ON clipboard_history(recency DESC)"
+    )
+    # Rows from before the column existed, or stored by other clients since,
+    # have no key yet; number them in capture order after the existing ones
+    base = conn.execute(
+        "SELECT coalesce(max(recency), 0) FROM clipboard_history"
+    ).fetchone()[0]
+    conn.execute(
+        """
+        UPDATE clipboard_history
+        SET recency = ? + unranked.n
+        FROM (
+            SELECT id, row_number() OVER (ORDER BY created_at, id) AS n
+            FROM clipboard_history
+            WHERE recency IS NULL
+        ) AS unranked
+        WHERE clipboard_history.id = unranked.id
+        """,
+        (base,),
+    )
+    if not exists:
+        # Give the query planner statistics for the new index once
+        conn.execute("ANALYZE")
+
+
+def _init_fts(conn: sqlite3.Connection) -> None:
+    """
+    Create the full-text index over clips.
 
-def add_clip(content: str) -> int:
-    conn = get_db_connection()
+    The index is contentless: it stores only tokens, so compressed clips are
+    not duplicated in plain text. _write_batch adds new clips to it, and any
+    clips stored by other clients (e.g. an older build) are caught up here.
+    """
+    global _fts_enabled
     try:
-        created_at = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-        cursor = conn.execute(
-            "INSERT INTO clipboard_history (created_at, content) VALUES (?, ?)",
-            (created_at, content),
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS clipboard_history_fts USING fts5(
+                content,
+                title,
+                category,
+                content='',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+            """
+        )
+    except sqlite3.OperationalError:
+        # SQLite compiled without FTS5
+        _fts_enabled = False
+        return
+
+    _fts_enabled = True
+    # Ids only grow, so clips past the highest indexed rowid are unindexed.
+    # The docsize shadow table has one row per indexed document.
+    last_indexed = conn.execute(
+        "SELECT coalesce(max(id), 0) FROM clipboard_history_fts_docsize"
+    ).fetchone()[0]
+    rows = conn.execute(
+        "SELECT id, content, content_blob, title, category "
+        "FROM clipboard_history WHERE id > ?",
+        (last_indexed,),
+    )
+    conn.executemany(
+        "INSERT INTO clipboard_history_fts (rowid, content, title, category) "
+        "VALUES (?, ?, ?, ?)",
+        (
+            (item_id, _clip_text(content, blob), title, category)
+            for item_id, content, blob, title, category in rows
+        ),
+    )
+
+
+def _index_clip(conn: sqlite3.Connection, item_id: int, content: str) -> None:
+    """Add a newly inserted clip to the full-text index, if there is one."""
+    if _fts_enabled:
+        conn.execute(
+            "INSERT INTO clipboard_history_fts (rowid, content) VALUES (?, ?)",
+            (item_id, content),
         )
-        conn.commit()
-        return cursor.lastrowid
+
+
+def _fts_query(search: str) -> str:
+    """
+    Turn search text into an FTS5 query matching every term as a prefix.
+
+    Terms are quoted so user input is never parsed as FTS5 syntax, and
+    prefixed so results keep up while a word is still being typed.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in search.split())
+
+
+def _like_pattern(search: str) -> str:
+    """Build a substring LIKE pattern, treating % and _ in the search literally."""
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _open_reader() -> sqlite3.Connection:
+    uri = Path(_get_db_file()).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    _register_functions(conn)
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")
+    return conn
+
+
+def get_db_connection() -> sqlite3.Connection:
+    """
+    Open a new connection to the clip database, owned by the caller.
+
+    The caller is responsible for closing it. This module's own functions
+    don't use it; they share one writer and a pool of readers instead.
+    """
+    # Make sure the file and schema exist
+    _get_writer()
+    conn = sqlite3.connect(_get_db_file())
+    _register_functions(conn)
+    return conn
+
+
+def _get_writer() -> sqlite3.Connection:
+    """
+    Return the shared writer connection. Callers must never close it.
+
+    The database file, schema and reader pool are set up on first use only;
+    every later call just hands back the already-open connection.
+    """
+    global _write_conn
+    with _init_lock:
+        if _write_conn is None:
+            conn = sqlite3.connect(_get_db_file(), check_same_thread=False)
+            _register_functions(conn)
+            _init_schema(conn)
+            # Readers need the file (and its WAL) to exist, so open them last
+            for _ in range(_READ_POOL_SIZE):
+                _read_pool.put(_open_reader())
+            _write_conn = conn
+    return _write_conn
+
+
+def close_db_connections() -> None:
+    """Flush queued clips, then close the writer and pooled reader connections."""
+    global _write_conn
+    _stop_writer_thread()
+    with _init_lock:
+        while True:
+            try:
+                _read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        if _write_conn is not None:
+            with _write_lock:
+                _write_conn.close()
+            _write_conn = None
+
+
+# Also flushes clips still queued for the background writer
+atexit.register(close_db_connections)
+
+
+@contextmanager
+def _checkout(write: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Borrow a connection for the duration of a ``with`` block.
+
+    Writes are serialized on the single writer connection; reads take one of
+    the pooled read-only connections, which WAL lets run alongside a writer.
+    """
+    writer = _get_writer()
+    if write:
+        with _write_lock:
+            try:
+                yield writer
+            except BaseException:
+                writer.rollback()
+                raise
+        return
+
+    conn = _read_pool.get()
+    try:
+        yield conn
     finally:
-        conn.close()
+        _read_pool.put(conn)
+
 
+def add_clip(content: str) -> "Future[int]":
+    """
+    Queue a clip for storage and return a Future that resolves to its id.
 
-def fetch_clips(limit: int = 20, search: Optional[str] = None) -> List[ClipItem]:
-    conn = get_db_connection()
+    Clips are written by a background thread that commits them in batches,
+    so the caller never waits on disk I/O. Re-copying text that is already in
+    the history does not add a new row; the existing clip's timestamp is
+    bumped so it sorts as newest again.
+    """
+    created_at = _utc_timestamp()
+    future: "Future[int]" = Future()
+    _ensure_writer_thread()
+    pending = (content, created_at, future)
     try:
-        if search:
-            rows = conn.execute(
-                """
-                SELECT id, created_at, title, category, content
-                FROM clipboard_history
-                WHERE content LIKE ? OR title LIKE ? OR category LIKE ?
-                ORDER BY id DESC
-                LIMIT ?
-                """,
-                (f"%{search}%", f"%{search}%", f"%{search}%", limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """
-                SELECT id, created_at, title, category, content
-                FROM clipboard_history
-                ORDER BY id DESC
-                LIMIT ?
-                """,
-                (limit,),
-            ).fetchall()
-
-        return [
-            ClipItem(
-                id=row[0],
-                created_at=row[1],
-                title=row[2],
-                category=row[3],
-                content=row[4],
+        _write_queue.put_nowait(pending)
+    except queue.Full:
+        # Apply backpressure rather than drop clips
+        _write_queue.put(pending)
+    return future
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as e.g. "2025-01-31T12:00:00Z"."""
+    global _cached_iso_ts
+    sec = int(time.time())
+    # Timestamps only have second precision, so format once per second
+    if sec != _cached_iso_ts[1]:
+        _cached_iso_ts = (time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec)), sec)
+    return _cached_iso_ts[0]
+
+
+def _ensure_writer_thread() -> None:
+    global _writer_thread
+    with _init_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="clipvault-writer", daemon=True
             )
-            for row in rows
-        ]
-    finally:
-        conn.close()
+            _writer_thread.start()
 
 
-def get_clip_by_id(item_id: int) -> Optional[ClipItem]:
-    conn = get_db_connection()
+def _writer_loop() -> None:
+    """Drain the write queue, committing up to one batch per transaction."""
+    stopping = False
+    while not stopping:
+        first = _write_queue.get()
+        if first is None:
+            _write_queue.task_done()
+            return
+
+        batch = [first]
+        deadline = time.monotonic() + _WRITE_BATCH_DELAY
+        while len(batch) < _WRITE_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                pending = _write_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if pending is None:
+                # Flush what we have, then exit
+                _write_queue.task_done()
+                stopping = True
+                break
+            batch.append(pending)
+
+        _write_batch(batch)
+        for _ in batch:
+            _write_queue.task_done()
+
+
+def _write_batch(batch: "List[tuple[str, str, Future[int]]]") -> None:
     try:
+        with _checkout(write=True) as conn:
+            # All rows share one implicit transaction, so one WAL sync per batch
+            ids = [
+                _store_clip(conn, content, created_at)
+                for content, created_at, _ in batch
+            ]
+            conn.commit()
+    except Exception as exc:
+        _get_clip_by_id_cached.cache_clear()
+        for _, _, future in batch:
+            future.set_exception(exc)
+        return
+
+    # Upserts may have bumped created_at on clips that are already cached
+    _get_clip_by_id_cached.cache_clear()
+    for (_, _, future), item_id in zip(batch, ids):
+        future.set_result(item_id)
+
+
+# Next value of the recency counter; max() is a single ix_recency lookup
+_NEXT_RECENCY = "SELECT coalesce(max(recency), 0) + 1 FROM clipboard_history"
+
+
+def _store_clip(conn: sqlite3.Connection, content: str, created_at: str) -> int:
+    """Insert one clip, or bump its duplicate to the newest; return its id."""
+    sha1 = _content_sha1(content)
+    # RETURNING yields no row when the insert is ignored as a duplicate
+    row = conn.execute(
+        f"""
+        INSERT OR IGNORE INTO clipboard_history
+            (created_at, content, content_blob, content_sha1, recency)
+        VALUES (?, ?, ?, ?, ({_NEXT_RECENCY}))
+        RETURNING id
+        """,
+        (created_at, *_encode_content(content), sha1),
+    ).fetchone()
+    if row is not None:
+        _index_clip(conn, row[0], content)
+        return row[0]
+
+    # Same text as an existing clip, which is already indexed
+    return conn.execute(
+        f"""
+        UPDATE clipboard_history
+        SET created_at = ?, recency = ({_NEXT_RECENCY})
+        WHERE content_sha1 = ?
+        RETURNING id
+        """,
+        (created_at, sha1),
+    ).fetchone()[0]
+
+
+def _flush_writes() -> None:
+    """Block until every queued clip has been committed."""
+    _write_queue.join()
+
+
+def _stop_writer_thread() -> None:
+    global _writer_thread
+    if _writer_thread is None:
+        return
+    _write_queue.put(None)
+    _writer_thread.join()
+    _writer_thread = None
+
+
+def search_uses_fts() -> bool:
+    """Return True if searches use the FTS5 index rather than the LIKE fallback."""
+    _get_writer()
+    return _fts_enabled
+
+
+def fetch_clips(
+    limit: int = 20,
+    search: Optional[str] = None,
+    order: str = "DESC",
+    with_content: bool = True,
+) -> List[ClipItem]:
+    """
+    Return the newest ``limit`` clips matching ``search``.
+
+    ``order`` only affects how that result is sorted: "DESC" is newest first,
+    "ASC" returns the same clips oldest first. With ``with_content=False``
+    clips carry only their preview and ``content`` is None, which spares
+    reading and decompressing full clip bodies.
+    """
+    if order not in ("ASC", "DESC"):
+        raise ValueError(f"order must be 'ASC' or 'DESC', not {order!r}")
+
+    # _fts_enabled is only known once the schema is set up, which checking
+    # out the first connection does
+    with _checkout() as conn:
+        if search and _fts_enabled and search.strip():
+            where = """
+                WHERE id IN (
+                    SELECT rowid
+                    FROM clipboard_history_fts
+                    WHERE clipboard_history_fts MATCH ?
+                )"""
+            params: tuple = (_fts_query(search), limit)
+        elif search:
+            where = f"WHERE ({_SEARCHABLE_EXPR}) LIKE ? ESCAPE '\\'"
+            params = (_like_pattern(search), limit)
+        else:
+            where = ""
+            params = (limit,)
+
+        columns = _CLIP_LIST_COLUMNS if with_content else _CLIP_SUMMARY_COLUMNS
+        sql = f"""
+            SELECT {columns}
+            FROM clipboard_history
+            {where}
+            ORDER BY recency DESC
+            LIMIT ?
+        """
+        rows = conn.execute(sql, params).fetchall()
+    if order == "ASC":
+        rows.reverse()
+
+    from_row = _clip_from_row if with_content else _summary_from_row
+    return [from_row(row) for row in rows]
+
+
+def get_clip_by_id(item_id: int) -> Optional[ClipItem]:
+    return _get_clip_by_id_cached(item_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_clip_by_id_cached(item_id: int) -> Optional[ClipItem]:
+    # ClipItems are immutable, so cached instances can be shared. The cache is
+    # cleared after every write that could change a clip.
+    with _checkout() as conn:
         row = conn.execute(
-            """
-            SELECT id, created_at, title, category, content
+            f"""
+            SELECT {_CLIP_COLUMNS}
             FROM clipboard_history
             WHERE id = ?
             """,
             (item_id,),
         ).fetchone()
-        if not row:
-            return None
-        return ClipItem(
-            id=row[0],
-            created_at=row[1],
-            title=row[2],
-            category=row[3],
-            content=row[4],
-        )
-    finally:
-        conn.close()
+    if not row:
+        return None
+    return _clip_from_row(row)
 
 
-def get_all_clips() -> List[ClipItem]:
-    """Return all clips in the database, newest first."""
-    conn = get_db_connection()
-    try:
-        rows = conn.execute(
-            """
-            SELECT id, created_at, title, category, content
+def iter_all_clips() -> Iterator[tuple]:
+    """
+    Yield every clip as a raw (id, created_at, title, category, content) row,
+    newest first.
+
+    Rows are stepped straight off the cursor, so memory use does not grow with
+    the history size; suited to feeding ``csv.writer.writerows``. A pooled
+    connection stays checked out until the generator is exhausted or closed.
+    """
+    for row in _iter_clip_rows():
+        *columns, content, content_blob = row
+        yield (*columns, _clip_text(content, content_blob))
+
+
+def get_all_clips() -> Iterator[ClipItem]:
+    """Yield all clips in the database as ClipItems, newest first."""
+    for row in _iter_clip_rows():
+        yield _clip_from_row(row)
+
+
+def _iter_clip_rows() -> Iterator[tuple]:
+    with _checkout() as conn:
+        yield from conn.execute(
+            f"""
+            SELECT {_CLIP_COLUMNS}
             FROM clipboard_history
-            ORDER BY id DESC
+            ORDER BY recency DESC
             """
-        ).fetchall()
-        return [
-            ClipItem(
-                id=row[0],
-                created_at=row[1],
-                title=row[2],
-                category=row[3],
-                content=row[4],
-            )
-            for row in rows
-        ]
-    finally:
-        conn.close()
+        )
+
+
+def get_all_clips_list() -> List[ClipItem]:
+    """Return all clips in the database as a list, newest first."""
+    return list(get_all_clips())
 
 
 def delete_all_clips() -> int:
     """Delete all clips from the database. Returns number of rows deleted."""
-    conn = get_db_connection()
-    try:
-        cursor = conn.execute("DELETE FROM clipboard_history")
-        conn.commit()
-        return cursor.rowcount
-    finally:
-        conn.close()
+    # Queued clips were copied before the delete, so they go too
+    _flush_writes()
+    with _checkout(write=True) as conn:
+        # Take the database write lock before counting, so a clip another
+        # process stores in between is both counted and deleted
+        conn.execute("BEGIN IMMEDIATE")
+        count = conn.execute("SELECT count(*) FROM clipboard_history").fetchone()[0]
+        if count > _DROP_TABLE_THRESHOLD:
+            # Dropping and recreating the tables costs the same at any size,
+            # unlike a DELETE that writes every page to the WAL
+            seq = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'clipboard_history'"
+            ).fetchone()
+            conn.execute("DROP TABLE IF EXISTS clipboard_history_fts")
+            conn.execute("DROP TABLE clipboard_history")
+            _create_schema(conn)
+            if seq is not None:
+                # Keep AUTOINCREMENT going, as the DELETE path does, so ids
+                # are never reused
+                conn.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) VALUES ('clipboard_history', ?)",
+                    seq,
+                )
+            conn.commit()
+            conn.execute("VACUUM")
+        else:
+            conn.execute("DELETE FROM clipboard_history")
+            if _fts_enabled:
+                # A contentless index can't follow row deletes by itself
+                conn.execute(
+                    "INSERT INTO clipboard_history_fts (clipboard_history_fts) "
+                    "VALUES ('delete-all')"
+                )
+            conn.commit()
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+        # Shrink the WAL file too, so disk usage actually goes down. This is
+        # best effort: an open reader (an export, another process) makes the
+        # checkpoint wait for the busy timeout and then give up anyway, so
+        # don't wait at all.
+        busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+        conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout)}")
+    _get_clip_by_id_cached.cache_clear()
+    return count
@@ -1,13 +1,17 @@
+import bisect
+import queue
+import re
 import threading
 import time
-from datetime import datetime
-from typing import Optional, List, Callable
+import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional, List, Callable, Hashable
 
 import os
 import sys
-import tempfile
 import getpass
-import msvcrt
+import ctypes
+from ctypes import wintypes
 
 import tkinter as tk
 from tkinter import messagebox, PhotoImage, filedialog
@@ -16,19 +20,27 @@ from tkinter import ttk
 import csv
 import webbrowser
 
-from PIL import Image
-import pystray
 import pyperclip
-import sv_ttk
 
 from copyhistory_core import (
     ClipItem,
     add_clip,
     fetch_clips,
     get_clip_by_id,
-    get_all_clips,
+    iter_all_clips,
     delete_all_clips,
+    search_uses_fts,
 )
+from copyhistory_clipboard import (
+    ClipboardListener,
+    paste_text,
+    read_clipboard_text,
+    read_initial_clipboard,
+)
+
+if TYPE_CHECKING:
+    import pystray
+    from PIL import Image
 
 
 # ============================
@@ -36,35 +48,50 @@ from copyhistory_core import (
 # ============================
 
 
+ERROR_ACCESS_DENIED = 5
+ERROR_ALREADY_EXISTS = 183
+
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_kernel32.CreateMutexW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR]
+_kernel32.CreateMutexW.restype = wintypes.HANDLE
+_kernel32.ReleaseMutex.argtypes = [wintypes.HANDLE]
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+
 class SingleInstanceError(RuntimeError):
     """Raised when another ClipVault instance is already running."""
 
 
 class SingleInstanceLock:
-    """Simple single-instance lock based on a per-user lock file."""
+    """Single-instance lock based on a per-user Win32 named mutex."""
 
-    def __init__(self, name: str = "copyhistory_gui.lock") -> None:
+    def __init__(self, name: str = "ClipVault") -> None:
         user = getpass.getuser() or "default"
-        lock_name = f"{user}_{name}"
-        self.lockfile = os.path.join(tempfile.gettempdir(), lock_name)
-        # Open (or create) the lock file
-        self._fh = open(self.lockfile, "w")
-        try:
-            # Try to acquire an exclusive, non-blocking lock on 1 byte
-            msvcrt.locking(self._fh.fileno(), msvcrt.LK_NBLCK, 1)
-        except OSError:
-            self._fh.close()
+        self.mutex_name = f"Global\\{name}_{user}"
+        # The kernel releases the mutex if the process dies, so there is no
+        # stale lock to clean up after a crash.
+        self._handle = _kernel32.CreateMutexW(None, True, self.mutex_name)
+        error = ctypes.get_last_error()
+        if self._handle and error != ERROR_ALREADY_EXISTS:
+            return
+
+        if self._handle:
+            _kernel32.CloseHandle(self._handle)
+            self._handle = None
+        if error in (ERROR_ALREADY_EXISTS, ERROR_ACCESS_DENIED):
+            # Access is denied when another session's instance owns the mutex
             raise SingleInstanceError("Another ClipVault instance is already running.")
+        raise ctypes.WinError(error)
 
     def release(self) -> None:
+        if self._handle is None:
+            return
         try:
-            msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
-        except OSError:
-            pass
-        try:
-            self._fh.close()
+            _kernel32.ReleaseMutex(self._handle)
+            _kernel32.CloseHandle(self._handle)
         except Exception:
             pass
+        self._handle = None
 
 
 def resource_path(relative_path: str) -> str:
@@ -76,6 +103,21 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+def _load_tray_image() -> "Image.Image":
+    """Load and decode the tray icon image. Safe to call off the Tk thread."""
+    # Pillow is only needed once the tray icon is built
+    from PIL import Image
+
+    try:
+        image = Image.open(resource_path("icon.png"))
+        # Image.open is lazy; decode here rather than on the tray thread
+        image.load()
+        return image
+    except Exception:
+        # Fallback: simple 16x16 blank image
+        return Image.new("RGBA", (16, 16), (0, 0, 0, 0))
+
+
 # ============================
 #   Clipboard monitor thread
 # ============================
@@ -86,34 +128,73 @@ class ClipboardMonitorThread(threading.Thread):
 
     def __init__(self, poll_interval: float = 0.4) -> None:
         super().__init__(daemon=True)
+        # Only used when clipboard change notifications are unavailable
         self.poll_interval = poll_interval
         self._stop_event = threading.Event()
+        # Set once a captured clip has been written; cleared by the GUI
+        self.dirty = threading.Event()
         self._last_value: Optional[str] = None
-        # Track whether we've already skipped the initial clipboard content
-        self._has_seen_initial_clip: bool = False
+        self._listener: Optional[ClipboardListener] = None
 
     def stop(self) -> None:
         """Stop the monitoring thread safely."""
         self._stop_event.set()
+        if self._listener is not None:
+            self._listener.stop()
 
     def run(self) -> None:
-        """Main loop that periodically checks the clipboard."""
-        while not self._stop_event.is_set():
+        """Wait for clipboard change notifications, or poll if they are unavailable."""
+        listener = ClipboardListener(self._on_clipboard_update)
+        if not listener.start():
+            self._poll()
+            return
+
+        self._listener = listener
+        # Ignore whatever was already on the clipboard when the app started
+        try:
+            self._last_value = read_clipboard_text()
+        except OSError:
+            self._last_value = None
+        # stop() may have raced with listener registration
+        if self._stop_event.is_set():
+            listener.stop()
+        listener.run()
+
+    def _on_clipboard_update(self) -> None:
+        """Handle WM_CLIPBOARDUPDATE on the listener thread."""
+        try:
+            current = read_clipboard_text()
+        except OSError:
+            return
+
+        if current and current != self._last_value:
+            self._last_value = current
+            self._store(current)
+
+    def _store(self, content: str) -> None:
+        """Queue a clip and flag the view as stale once it is written."""
+        add_clip(content).add_done_callback(lambda _: self.dirty.set())
+
+    def _poll(self) -> None:
+        """Fallback loop that periodically checks the clipboard."""
+        stop_event = self._stop_event
+        poll_interval = self.poll_interval
+
+        # Ignore whatever was already on the clipboard when the app started
+        last = read_initial_clipboard(poll_interval, stop_event)
+
+        while not stop_event.is_set():
             try:
-                current = pyperclip.paste()
+                current = paste_text()
             except Exception:
-                time.sleep(self.poll_interval)
+                time.sleep(poll_interval)
                 continue
 
-            if not self._has_seen_initial_clip:
-                # Ignore whatever was already on the clipboard when the app started
-                self._last_value = current if isinstance(current, str) else None
-                self._has_seen_initial_clip = True
-            elif current and isinstance(current, str) and current != self._last_value:
-                self._last_value = current
-                add_clip(current)
+            if current and current != last:
+                last = current
+                self._store(current)
 
-            time.sleep(self.poll_interval)
+            time.sleep(poll_interval)
 
 
 # ============================
@@ -124,6 +205,11 @@ class ClipboardMonitorThread(threading.Thread):
 class SnippetCard(ttk.Frame):
     """Single card component for one clipboard snippet."""
 
+    # Click handling is bound once on this bindtag instead of per widget, so
+    # a new card doesn't register its own Tcl callbacks
+    _CLICK_TAG = "SnippetCardClick"
+    _click_tag_bound = False
+
     def __init__(
         self,
         master,
@@ -174,35 +260,333 @@ class SnippetCard(ttk.Frame):
         self.copy_button.grid(row=0, column=2, padx=(10, 14), pady=6, sticky="e")
 
         # Mouse bindings
-        self.bind("<Button-1>", self._click)
-        self.bind("<Double-Button-1>", self._double_click)
+        if not SnippetCard._click_tag_bound:
+            self.bind_class(self._CLICK_TAG, "<Button-1>", SnippetCard._click)
+            self.bind_class(
+                self._CLICK_TAG, "<Double-Button-1>", SnippetCard._double_click
+            )
+            SnippetCard._click_tag_bound = True
+
+        for widget in (self, self.label, self.indicator):
+            widget.bindtags((self._CLICK_TAG,) + widget.bindtags())
 
-        for widget in (self.label, self.indicator):
-            widget.bind("<Button-1>", self._click)
-            widget.bind("<Double-Button-1>", self._double_click)
+    def rebind(self, item: ClipItem, preview_text: str) -> None:
+        """Show a different snippet in this card without rebuilding its widgets."""
+        self.item = item
+        self.item_id = item.id
+        self.label.configure(text=preview_text)
 
     # ---------- selection handling ----------
 
     def set_selected(self, value: bool) -> None:
         """Mark this card as selected / not selected and update style."""
+        if value == self._selected:
+            return
         self._selected = value
-        if value:
-            self.configure(style="SnippetCard.Selected.TFrame")
-        else:
-            self.configure(style="SnippetCard.TFrame")
+        self.state(["selected"] if value else ["!selected"])
 
     # ---------- event callbacks ----------
 
-    def _click(self, event) -> None:
-        self._on_select(self.item_id, self)
+    @staticmethod
+    def _card_of(widget) -> Optional["SnippetCard"]:
+        while widget is not None and not isinstance(widget, SnippetCard):
+            widget = widget.master
+        return widget
+
+    @staticmethod
+    def _click(event) -> None:
+        card = SnippetCard._card_of(event.widget)
+        if card is not None:
+            card._on_select(card.item_id, card)
 
-    def _double_click(self, event) -> None:
-        self._on_details(self.item_id)
+    @staticmethod
+    def _double_click(event) -> None:
+        card = SnippetCard._card_of(event.widget)
+        if card is not None:
+            card._on_details(card.item_id)
 
     def _copy_click(self) -> None:
         self._on_copy(self.item_id)
 
 
+class DayHeader(ttk.Label):
+    """Clickable header above the snippets of one local date."""
+
+    def __init__(
+        self,
+        master,
+        date_str: str,
+        expanded: bool,
+        on_toggle: Callable[[str], None],
+        *args,
+        **kwargs,
+    ):
+        super().__init__(master, *args, style="DayHeader.TLabel", **kwargs)
+        self._on_toggle = on_toggle
+        self.rebind(date_str, expanded)
+        self.bind("<Button-1>", self._click)
+
+    def rebind(self, date_str: str, expanded: bool) -> None:
+        """Show a different date (or expand state) in this header."""
+        self.date_str = date_str
+        self.configure(text=f"{'▼' if expanded else '▶'} {date_str}")
+
+    def _click(self, event) -> None:
+        self._on_toggle(self.date_str)
+
+
+# ============================
+#   Virtualized snippet list
+# ============================
+
+
+class VirtualSnippetList:
+    """
+    Scrollable list that only keeps widgets for rows inside the viewport.
+
+    Rows are plain ``(kind, key, args)`` tuples where kind is "header" or
+    "card" and key identifies the row across updates. Widgets are created
+    through per-kind factories called as ``factory(*args)``; once scrolled out
+    of view they go back to a pool and are rebound via ``widget.rebind(*args)``
+    to the rows that scroll in.
+    """
+
+    # kind -> (x offset, (pad above, pad below), stretch to full width)
+    _PLACEMENT = {
+        "header": (8, (8, 2), False),
+        "card": (10, (4, 6), True),
+    }
+
+    # Extra rows kept alive above and below the viewport, so small scrolls
+    # do not expose rows that are still waiting for a widget
+    _BUFFER_ROWS = 4
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        window_id: int,
+        container: ttk.Frame,
+        scrollbar: ttk.Scrollbar,
+        factories: dict[str, Callable[..., tk.Widget]],
+        on_show: Callable[[str, tk.Widget], None],
+    ) -> None:
+        self.canvas = canvas
+        self.container = container
+        self._window_id = window_id
+        self._scrollbar = scrollbar
+        self._factories = factories
+        self._on_show = on_show
+
+        self._rows: List[tuple[str, Hashable, tuple]] = []
+        self._offsets: List[int] = []
+        self._heights: dict[str, int] = {}
+        self._pools: dict[str, List[tk.Widget]] = {kind: [] for kind in factories}
+        self._live: dict[int, tk.Widget] = {}
+        # Widgets from before set_rows, by row key, awaiting reuse
+        self._carry: dict[Hashable, tuple[tk.Widget, tuple]] = {}
+        self._render_pending = False
+
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+
+    def set_rows(self, rows: List[tuple[str, Hashable, tuple]]) -> None:
+        """
+        Replace the list contents and redraw the visible rows.
+
+        On-screen rows whose key is still present keep their widget and are
+        only moved (and rebound if their data changed), so e.g. one new clip
+        at the top costs a single rebind rather than one per visible row.
+        """
+        # Measure first: measuring a new kind runs idle tasks, which may
+        # include a pending render that must still see the old rows
+        offsets = []
+        y = 0
+        for kind, _, args in rows:
+            offsets.append(y)
+            y += self._row_height(kind, args)
+
+        self._carry = {
+            self._rows[index][1]: (widget, self._rows[index][2])
+            for index, widget in self._live.items()
+        }
+        self._live = {}
+        self._rows = rows
+        self._offsets = offsets
+
+        # Children are placed, not gridded, so size the container explicitly.
+        # The total height is known here, so set the exact scrollregion too
+        # rather than waiting for the container's <Configure> and bbox().
+        height = max(y, 1)
+        self.canvas.itemconfigure(self._window_id, height=height)
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+        self.render()
+
+        # Rows that were removed or scrolled out of view
+        for widget, _ in self._carry.values():
+            widget.place_forget()
+            self._pools[widget.row_kind].append(widget)
+        self._carry = {}
+
+    def widgets(self, kind: str) -> List[tk.Widget]:
+        """Return the widgets of one kind that are currently on screen."""
+        return [w for i, w in self._live.items() if self._rows[i][0] == kind]
+
+    def schedule_render(self) -> None:
+        """Re-render once Tk is idle, coalescing bursts of scroll/resize events."""
+        if not self._render_pending:
+            self._render_pending = True
+            self.canvas.after_idle(self.render)
+
+    def render(self) -> None:
+        """Show the rows that intersect the viewport and recycle the rest."""
+        self._render_pending = False
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = bisect.bisect_right(self._offsets, top) - 1 - self._BUFFER_ROWS
+        last = bisect.bisect_left(self._offsets, bottom) + self._BUFFER_ROWS
+        visible = range(max(first, 0), min(last, len(self._rows)))
+
+        for index in [i for i in self._live if i not in visible]:
+            self._release(index)
+        for index in visible:
+            if index not in self._live:
+                self._show(index)
+        self._trim_pools()
+
+    def _trim_pools(self) -> None:
+        """Destroy pooled widgets beyond twice what a full viewport could need."""
+        if not self._heights:
+            return
+        rows_per_view = self.canvas.winfo_height() // min(self._heights.values()) + 1
+        needed = rows_per_view + 2 * self._BUFFER_ROWS
+        for pool in self._pools.values():
+            while len(pool) > 2 * needed:
+                pool.pop().destroy()
+
+    def _on_yscroll(self, first: str, last: str) -> None:
+        self._scrollbar.set(first, last)
+        self.schedule_render()
+
+    def _row_height(self, kind: str, args: tuple) -> int:
+        """Return the slot height of a row kind, measuring it once."""
+        if kind not in self._heights:
+            widget = self._create(kind, args)
+            widget.update_idletasks()
+            pad_top, pad_bottom = self._PLACEMENT[kind][1]
+            self._heights[kind] = widget.winfo_reqheight() + pad_top + pad_bottom
+            self._pools[kind].append(widget)
+        return self._heights[kind]
+
+    def _show(self, index: int) -> None:
+        kind, key, args = self._rows[index]
+        pool = self._pools[kind]
+        carried = self._carry.pop(key, None)
+        if carried is not None:
+            widget, old_args = carried
+            if old_args != args:
+                widget.rebind(*args)
+        elif pool:
+            widget = pool.pop()
+            widget.rebind(*args)
+        else:
+            widget = self._create(kind, args)
+
+        x, (pad_top, pad_bottom), stretch = self._PLACEMENT[kind]
+        y = self._offsets[index] + pad_top
+        if stretch:
+            height = self._heights[kind] - pad_top - pad_bottom
+            widget.place(x=x, y=y, relwidth=1.0, width=-2 * x, height=height)
+        else:
+            widget.place(x=x, y=y)
+        self._live[index] = widget
+        self._on_show(kind, widget)
+
+    def _create(self, kind: str, args: tuple) -> tk.Widget:
+        widget = self._factories[kind](*args)
+        widget.row_kind = kind
+        return widget
+
+    def _release(self, index: int) -> None:
+        widget = self._live.pop(index)
+        widget.place_forget()
+        self._pools[self._rows[index][0]].append(widget)
+
+
+# ============================
+#   Search-as-you-type index
+# ============================
+
+
+class ClipPrefixIndex:
+    """
+    Word-prefix trie over the clips currently loaded in the list.
+
+    Lets the list be filtered on every keystroke without a database query.
+    Words are split and folded like FTS5's unicode61 tokenizer, so a search
+    term that is a single word matches exactly what the FTS5 search finds:
+    clips with a word starting with it. A term that splits into several
+    words ("src/main") is a phrase to FTS5; the trie cannot check word
+    order, so it only narrows the list to clips containing all of them.
+    """
+
+    # Key under which a node stores the ids of clips with a word ending there
+    _END = ""
+    # Letters and digits, like FTS5's unicode61 tokenizer; unlike \w, "_"
+    # separates words, so "name" finds "my_func_name"
+    _WORD_RE = re.compile(r"[^\W_]+")
+
+    def __init__(self, clips: List[ClipItem]) -> None:
+        self._root: dict = {}
+        for item in clips:
+            text = "\n".join(filter(None, (item.content, item.title, item.category)))
+            for word in set(self.tokenize(text)):
+                node = self._root
+                for ch in word:
+                    node = node.setdefault(ch, {})
+                node.setdefault(self._END, set()).add(item.id)
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        # unicode61 lowercases and strips diacritics but, unlike NFKD and
+        # casefold(), keeps ligatures such as "ﬁ" and "ß" as they are
+        folded = text.lower()
+        if not folded.isascii():
+            folded = unicodedata.normalize("NFD", folded)
+            folded = "".join(c for c in folded if not unicodedata.combining(c))
+        return cls._WORD_RE.findall(folded)
+
+    @classmethod
+    def is_exact(cls, search: str) -> bool:
+        """Whether ``match(search)`` is exactly the FTS5 result, not a superset."""
+        return all(len(cls.tokenize(term)) <= 1 for term in search.split())
+
+    def match(self, search: str) -> set:
+        """Return the ids of clips having a word starting with every search word."""
+        result: Optional[set] = None
+        for term in self.tokenize(search):
+            ids = self._with_prefix(term)
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result or set()
+
+    def _with_prefix(self, prefix: str) -> set:
+        node = self._root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return set()
+
+        ids: set = set()
+        stack = [node]
+        while stack:
+            for key, child in stack.pop().items():
+                if key == self._END:
+                    ids |= child
+                else:
+                    stack.append(child)
+        return ids
+
+
 # ============================
 #   Main application window
 # ============================
@@ -211,10 +595,15 @@ class SnippetCard(ttk.Frame):
 class CopyHistoryApp(tk.Tk):
     """Main window for ClipVault with Sun Valley light theme."""
 
+    # Number of newest clips the list shows
+    _FETCH_LIMIT = 200
+
     def __init__(self) -> None:
         super().__init__()
 
-        # Apply Sun Valley light theme
+        # Apply Sun Valley light theme (imported here: loading it parses Tcl)
+        import sv_ttk
+
         sv_ttk.set_theme("light")
 
         self.title("ClipVault - Clipboard History")
@@ -227,14 +616,13 @@ class CopyHistoryApp(tk.Tk):
         except Exception:
             self._icon_photo = None
 
-        # Logo (no longer used in the banner, but kept for possible future use)
-        self._logo_photo: Optional[PhotoImage]
+        # Logo: one shared half-size image for the banner and About dialog.
+        # The full-size source is only needed to subsample from, so it is not
+        # kept around in Tk's image registry.
         self._logo_small: Optional[PhotoImage]
         try:
-            self._logo_photo = PhotoImage(file=resource_path("logo.png"))
-            self._logo_small = self._logo_photo.subsample(2, 2)
+            self._logo_small = PhotoImage(file=resource_path("logo.png")).subsample(2, 2)
         except Exception:
-            self._logo_photo = self._icon_photo
             self._logo_small = self._icon_photo
 
         self.geometry("900x600")
@@ -243,30 +631,59 @@ class CopyHistoryApp(tk.Tk):
         self.monitor_thread = ClipboardMonitorThread(poll_interval=0.4)
         self.monitor_thread.start()
 
+        # All SQLite reads for the UI run here, so the Tk loop never blocks
+        # on the database. Workers never touch Tk: finished calls go on a
+        # queue that the Tk side drains while any are outstanding.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="clipvault-db"
+        )
+        # (callback, argument, whether it ends a job): finished calls, and
+        # progress updates posted by jobs still running
+        self._db_results: "queue.Queue[tuple[Callable[[Any], None], Any, bool]]" = (
+            queue.Queue()
+        )
+        self._db_jobs: int = 0
+        self._refresh_pending: bool = False
+        # Force flag of a refresh requested while one was in flight
+        self._refresh_queued: Optional[bool] = None
+        # Unfiltered clips from the last full load, plus a word index over
+        # them for filtering while typing; None once they may be out of date
+        self._loaded_clips: Optional[List[ClipItem]] = None
+        self._prefix_index: Optional[ClipPrefixIndex] = None
+        # The clips an index is being built for on the DB worker, if any
+        self._indexing_clips: Optional[List[ClipItem]] = None
+
         # System tray icon support
-        self.tray_icon: Optional[pystray.Icon] = None
+        self.tray_icon: Optional["pystray.Icon"] = None
+        self._tray_loading: bool = False
+        # Built on first use, then hidden and shown again
+        self._about_window: Optional[tk.Toplevel] = None
 
         # Single-instance lock (owned by the app for the GUI lifetime)
         self._instance_lock: Optional[SingleInstanceLock] = None
 
         self.last_selected_id: Optional[int] = None
-        self.cards: List[SnippetCard] = []
+        # date -> {"items": [(ClipItem, preview)], "expanded": bool}
         self.day_groups: dict[str, dict] = {}
         self._last_clip_ids: List[int] = []
         self._last_search_text: Optional[str] = None
         self.sort_desc: bool = True  # True = newest first
         self._last_sort_desc: bool = True
+        # Wheel delta (in Windows units of 120 per notch) awaiting a scroll
+        self._pending_wheel: int = 0
+        self._wheel_scheduled: bool = False
 
         # Search placeholder handling
         self._search_placeholder = "Search snippets..."
         self._search_has_placeholder: bool = True
+        self._search_after_id: Optional[str] = None
 
         self._build_menubar()
 
         self._setup_styles()
         self._build_ui()
         self._refresh_data()
-        self._schedule_auto_refresh()
+        self._schedule_monitor_poll()
 
         # Ensure tray icon exists from startup (not only after closing)
         self._ensure_tray_icon()
@@ -275,8 +692,6 @@ class CopyHistoryApp(tk.Tk):
         """Configure styles building on top of Sun Valley theme."""
         style = ttk.Style(self)
 
-        base_bg = style.lookup("TFrame", "background") or "#ffffff"
-
         # Background for snippet area behind cards
         container_bg = "#e9edf5"
         self._snippet_container_bg = container_bg
@@ -295,12 +710,12 @@ class CopyHistoryApp(tk.Tk):
             borderwidth=1,
             background=card_bg,
         )
-        style.configure(
-            "SnippetCard.Selected.TFrame",
-            padding=10,
-            relief="solid",
-            borderwidth=1,
-            background=card_selected_bg,
+        # Selection is a widget state rather than a separate style, so
+        # toggling it does not make Tk re-resolve the card's style.
+        style.map(
+            "SnippetCard.TFrame",
+            relief=[("selected", "solid")],
+            background=[("selected", card_selected_bg)],
         )
 
         accent_fg = style.lookup("Accent.TButton", "foreground") or style.lookup(
@@ -386,13 +801,14 @@ class CopyHistoryApp(tk.Tk):
             style="Search.TEntry",
         )
         self.search_entry.grid(row=0, column=0, sticky="ew", pady=(0, 4))
-        self.search_entry.bind("<Return>", lambda event: self._refresh_data())
         self.search_entry.bind("<FocusIn>", self._on_search_focus_in)
         self.search_entry.bind("<FocusOut>", self._on_search_focus_out)
 
         # Initialize placeholder
         self.search_var.set(self._search_placeholder)
         self.search_entry.configure(foreground="#8a8a8a")
+        # Registered after the placeholder is set so it doesn't trigger a search
+        self.search_var.trace_add("write", self._on_search_changed)
 
         # Sort toggle button (asc/desc by date)
         self.sort_button = ttk.Button(
@@ -417,12 +833,8 @@ class CopyHistoryApp(tk.Tk):
         center_frame.grid_columnconfigure(0, weight=1)
 
         self.snippet_canvas = tk.Canvas(center_frame, highlightthickness=0)
-        canvas_bg = getattr(
-            self,
-            "_snippet_container_bg",
-            ttk.Style(self).lookup("TFrame", "background") or "#ffffff",
-        )
-        self.snippet_canvas.configure(background=canvas_bg)
+        # _setup_styles always runs first and resolves the theme colours
+        self.snippet_canvas.configure(background=self._snippet_container_bg)
         self.snippet_canvas.grid(row=0, column=0, sticky="nsew")
 
         scrollbar = ttk.Scrollbar(
@@ -430,8 +842,6 @@ class CopyHistoryApp(tk.Tk):
         )
         scrollbar.grid(row=0, column=1, sticky="ns")
 
-        self.snippet_canvas.configure(yscrollcommand=scrollbar.set)
-
         self.snippet_scroll = ttk.Frame(
             self.snippet_canvas,
             style="SnippetContainer.TFrame",
@@ -440,15 +850,23 @@ class CopyHistoryApp(tk.Tk):
             (0, 0), window=self.snippet_scroll, anchor="nw"
         )
 
-        self.snippet_scroll.bind(
-            "<Configure>",
-            lambda event: self.snippet_canvas.configure(
-                scrollregion=self.snippet_canvas.bbox("all")
-            ),
-        )
         self.snippet_canvas.bind("<Configure>", self._on_snippet_canvas_configure)
+        # Bound app-wide because cards cover the canvas; filtered in the handler
+        self.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.bind_all("<Button-4>", self._on_mousewheel)
+        self.bind_all("<Button-5>", self._on_mousewheel)
 
-        self.snippet_scroll.grid_columnconfigure(0, weight=1)
+        self.snippet_list = VirtualSnippetList(
+            self.snippet_canvas,
+            self._snippet_window_id,
+            self.snippet_scroll,
+            scrollbar,
+            factories={
+                "header": self._create_day_header,
+                "card": self._create_snippet_card,
+            },
+            on_show=self._on_row_shown,
+        )
 
         # Bottom status bar
         bottom_frame = ttk.Frame(self, padding=(16, 0, 16, 12))
@@ -463,29 +881,83 @@ class CopyHistoryApp(tk.Tk):
         )
         self.status_label.grid(row=0, column=0, padx=4, pady=6, sticky="w")
 
+        # Pin the static rows at their natural height so e.g. a new status
+        # text doesn't propagate a relayout of the whole window; the list's
+        # frame likewise takes its size from the window, not from the canvas.
+        self.update_idletasks()
+        for frame in (logo_frame, top_frame, bottom_frame):
+            frame.configure(height=frame.winfo_reqheight())
+            frame.grid_propagate(False)
+        center_frame.grid_propagate(False)
+
     def _on_snippet_canvas_configure(self, event: tk.Event) -> None:
         """Keep cards as wide as the canvas."""
         self.snippet_canvas.itemconfigure(self._snippet_window_id, width=event.width)
+        # A taller viewport may expose rows that have no widget yet
+        self.snippet_list.schedule_render()
+
+    def _on_mousewheel(self, event: tk.Event) -> None:
+        """Accumulate wheel events and scroll at most once per idle cycle."""
+        if not str(event.widget).startswith(str(self.snippet_canvas)):
+            return
+        if event.num == 4:
+            self._pending_wheel -= 120
+        elif event.num == 5:
+            self._pending_wheel += 120
+        else:
+            self._pending_wheel -= event.delta
+        if not self._wheel_scheduled:
+            self._wheel_scheduled = True
+            self.after_idle(self._apply_wheel)
+
+    def _apply_wheel(self) -> None:
+        self._wheel_scheduled = False
+        # int() truncates toward zero; keep the remainder of partial notches
+        units = int(self._pending_wheel / 120)
+        self._pending_wheel -= units * 120
+        if units:
+            self.snippet_canvas.yview_scroll(units, "units")
+
+    def _create_day_header(self, date_str: str, expanded: bool) -> DayHeader:
+        return DayHeader(
+            self.snippet_scroll,
+            date_str,
+            expanded,
+            on_toggle=self._toggle_day_group,
+        )
+
+    def _create_snippet_card(self, item: ClipItem, preview_text: str) -> SnippetCard:
+        return SnippetCard(
+            self.snippet_scroll,
+            item=item,
+            preview_text=preview_text,
+            on_select=self._on_card_selected,
+            on_copy=self._copy_item_to_clipboard,
+            on_details=self._show_item_details,
+        )
+
+    def _on_row_shown(self, kind: str, widget: tk.Widget) -> None:
+        """Sync selection state onto a card as it (re)appears."""
+        if kind == "card":
+            widget.set_selected(widget.item_id == self.last_selected_id)
 
     # ---------- auto refresh ----------
 
-    def _schedule_auto_refresh(self) -> None:
-        """Schedule periodic refresh of the list view."""
-        self.after(3000, self._auto_refresh_callback)
+    def _schedule_monitor_poll(self) -> None:
+        """Check for newly captured clips shortly."""
+        self.after(200, self._poll_monitor_event)
 
-    def _auto_refresh_callback(self) -> None:
-        self._refresh_data()
-        self._schedule_auto_refresh()
+    def _poll_monitor_event(self) -> None:
+        """Refresh the list only when the monitor stored something new."""
+        dirty = self.monitor_thread.dirty
+        if dirty.is_set():
+            dirty.clear()
+            self._forget_loaded_clips()
+            self._refresh_data()
+        self._schedule_monitor_poll()
 
     # ---------- data loading / view ----------
 
-    def _clear_cards(self) -> None:
-        # Destroy all widgets inside the scroll frame (cards + headers)
-        for child in self.snippet_scroll.winfo_children():
-            child.destroy()
-        self.cards.clear()
-        self.day_groups.clear()
-
     def _export_all_snippets(self) -> None:
         """Export all snippets to a CSV file."""
         path = filedialog.asksaveasfilename(
@@ -496,15 +968,40 @@ class CopyHistoryApp(tk.Tk):
         if not path:
             return
 
+        self.status_label.configure(text="Exporting snippets...")
+        # Large histories take a while; keep the UI responsive meanwhile
+        self._submit(
+            self._write_export,
+            path,
+            on_done=lambda future: self._finish_export(future, path),
+        )
+
+    def _write_export(self, path: str) -> int:
+        """Stream all clips into a CSV file. Runs on the DB worker."""
+        count = 0
+
+        def rows():
+            nonlocal count
+            for row in iter_all_clips():
+                count += 1
+                if count % 1000 == 0:
+                    self._post_progress(self._show_export_progress, count)
+                yield row
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "created_at", "title", "category", "content"])
+            writer.writerows(rows())
+        return count
+
+    def _show_export_progress(self, count: int) -> None:
+        self.status_label.configure(text=f"Exporting snippets... {count}")
+
+    def _finish_export(self, future: Future, path: str) -> None:
+        # Restores the "Showing N item(s)" status text
+        self._refresh_data()
         try:
-            clips = get_all_clips()
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["id", "created_at", "title", "category", "content"])
-                for item in clips:
-                    writer.writerow(
-                        [item.id, item.created_at, item.title, item.category, item.content]
-                    )
+            count = future.result()
         except Exception as exc:
             messagebox.showerror(
                 "Export error",
@@ -514,7 +1011,7 @@ class CopyHistoryApp(tk.Tk):
 
         messagebox.showinfo(
             "Export completed",
-            f"Exported {len(clips)} snippets to:\n{path}",
+            f"Exported {count} snippets to:\n{path}",
         )
 
     def _delete_all_snippets(self) -> None:
@@ -526,8 +1023,13 @@ class CopyHistoryApp(tk.Tk):
         ):
             return
 
+        # A large history is dropped and vacuumed, which can take a while
+        self.status_label.configure(text="Deleting snippets...")
+        self._submit(delete_all_clips, on_done=self._finish_delete)
+
+    def _finish_delete(self, future: Future) -> None:
         try:
-            count = delete_all_clips()
+            count = future.result()
         except Exception as exc:
             messagebox.showerror(
                 "Delete error",
@@ -536,6 +1038,7 @@ class CopyHistoryApp(tk.Tk):
             return
 
         self._last_clip_ids = []
+        self._forget_loaded_clips()
         self._refresh_data(force=True)
 
         messagebox.showinfo(
@@ -545,13 +1048,28 @@ class CopyHistoryApp(tk.Tk):
 
     def _show_about_dialog(self) -> None:
         """Show an About dialog with logo, link and short intro."""
+        about = self._about_window
+        if about is None:
+            about = self._about_window = self._build_about_dialog()
+        else:
+            about.deiconify()
+            about.lift()
+        about.grab_set()
+
+    def _hide_about_dialog(self) -> None:
+        # The dialog's content is static, so keep it around for next time
+        if self._about_window is not None:
+            self._about_window.grab_release()
+            self._about_window.withdraw()
+
+    def _build_about_dialog(self) -> tk.Toplevel:
         about = tk.Toplevel(self)
         about.title("About ClipVault")
         about.geometry("380x260")
         if self._icon_photo is not None:
             about.iconphoto(False, self._icon_photo)
         about.transient(self)
-        about.grab_set()
+        about.protocol("WM_DELETE_WINDOW", self._hide_about_dialog)
 
         content = ttk.Frame(about, padding=16)
         content.pack(fill="both", expand=True)
@@ -594,10 +1112,79 @@ class CopyHistoryApp(tk.Tk):
         close_button = ttk.Button(
             content,
             text="Close",
-            command=about.destroy,
+            command=self._hide_about_dialog,
             width=10,
         )
         close_button.grid(row=4, column=0, pady=(4, 0))
+        return about
+
+    def _on_search_changed(self, *args) -> None:
+        """Search as the user types, once they pause for a moment."""
+        if self._search_has_placeholder:
+            return
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        if self._filter_loaded_clips(self.search_var.get().strip()):
+            return
+        self._search_after_id = self.after(200, self._do_search)
+
+    def _filter_loaded_clips(self, search_text: str) -> bool:
+        """
+        Filter the already-loaded clips in memory for instant feedback.
+
+        Returns True when that result is final, i.e. the last full load was
+        smaller than a page and so held the whole history, and the database
+        search is FTS-based and matches these terms the same way; otherwise
+        the debounced database search still has to run.
+        """
+        clips = self._loaded_clips
+        if clips is None or self._refresh_pending:
+            return False
+
+        if search_text:
+            if self._prefix_index is None:
+                # Building the index reads every clip's text; keep that off
+                # the Tk thread and let the database search answer this time
+                self._build_prefix_index(clips)
+                return False
+            ids = self._prefix_index.match(search_text)
+            matches = [item for item in clips if item.id in ids]
+        else:
+            matches = clips
+        self._show_clips(matches, search_text or None, self.sort_desc, force=False)
+        # Only final if the database search would use the same word-prefix
+        # matching; the LIKE fallback matches substrings instead
+        return (
+            len(clips) < self._FETCH_LIMIT
+            and search_uses_fts()
+            and ClipPrefixIndex.is_exact(search_text)
+        )
+
+    def _build_prefix_index(self, clips: List[ClipItem]) -> None:
+        if self._indexing_clips is clips:
+            return
+        self._indexing_clips = clips
+        self._submit(
+            ClipPrefixIndex,
+            clips,
+            on_done=lambda future: self._set_prefix_index(future, clips),
+        )
+
+    def _set_prefix_index(self, future: Future, clips: List[ClipItem]) -> None:
+        if self._indexing_clips is clips:
+            self._indexing_clips = None
+        # Drop the index if a newer load replaced these clips meanwhile
+        if self._loaded_clips is clips and future.exception() is None:
+            self._prefix_index = future.result()
+
+    def _forget_loaded_clips(self) -> None:
+        self._loaded_clips = None
+        self._prefix_index = None
+
+    def _do_search(self) -> None:
+        self._search_after_id = None
+        self._refresh_data()
 
     def _on_search_focus_in(self, event: tk.Event) -> None:
         """Clear placeholder text when search field gains focus."""
@@ -627,32 +1214,109 @@ class CopyHistoryApp(tk.Tk):
         """Toggle between ascending and descending sort by date."""
         self.sort_desc = not self.sort_desc
         self._update_sort_button_label()
-        # Force refresh to apply new sort order
-        self._refresh_data()
+        if self._refresh_pending:
+            # The in-flight result is stale now; let it re-fetch in order
+            self._forget_loaded_clips()
+            self._refresh_data()
+            return
 
-    def _local_date_str(self, created_at: Optional[str]) -> str:
-        """Return local-date string (YYYY-MM-DD) from stored UTC timestamp."""
-        if not created_at:
-            return "Unknown date"
-        try:
-            ts = created_at.strip()
-            if ts.endswith("Z"):
-                ts = ts.replace("Z", "+00:00")
-            dt_utc = datetime.fromisoformat(ts)
-            local_date = dt_utc.astimezone().date()
-            return local_date.isoformat()
-        except Exception:
-            # Fallback: just take the date part if present
-            return (created_at.split("T", 1)[0] or "Unknown date")
+        # Both orders show the same newest clips, so just reverse the days
+        # and the clips within them; the list keeps its widgets by key
+        self.day_groups = dict(reversed(self.day_groups.items()))
+        for group in self.day_groups.values():
+            group["items"].reverse()
+        self._last_clip_ids.reverse()
+        self._last_sort_desc = self.sort_desc
+        if self._loaded_clips is not None:
+            self._loaded_clips.reverse()
+        self._show_day_groups()
+
+    def _submit(self, fn: Callable, *args, on_done: Callable[[Future], None]) -> None:
+        """Run ``fn`` on the DB worker; ``on_done(future)`` runs on the Tk thread."""
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda f: self._db_results.put((on_done, f, True)))
+        self._db_jobs += 1
+        if self._db_jobs == 1:
+            self.after(10, self._drain_db_results)
+
+    def _post_progress(self, callback: Callable[[Any], None], value: Any) -> None:
+        """Queue ``callback(value)`` for the Tk thread; for use by running jobs."""
+        self._db_results.put((callback, value, False))
+
+    def _drain_db_results(self) -> None:
+        """Hand finished DB calls to their callbacks, on the Tk thread."""
+        while True:
+            try:
+                callback, value, finished = self._db_results.get_nowait()
+            except queue.Empty:
+                break
+            if finished:
+                self._db_jobs -= 1
+            callback(value)
+        if self._db_jobs:
+            self.after(10, self._drain_db_results)
 
     def _refresh_data(self, force: bool = False) -> None:
-        """Fetch clips from the database and build cards."""
+        """Fetch clips from the database in the background and build cards."""
+        if self._refresh_pending:
+            # Re-fetch once the current query returns, with the latest state
+            self._refresh_queued = force or bool(self._refresh_queued)
+            return
+
         raw_search = self.search_var.get()
         if self._search_has_placeholder:
             search_text = None
         else:
             search_text = raw_search.strip() or None
-        clips = fetch_clips(limit=200, search=search_text)
+        sort_desc = self.sort_desc
+
+        self._refresh_pending = True
+        # SQLite returns rows already sorted, with the local date attached
+        self._submit(
+            fetch_clips,
+            self._FETCH_LIMIT,
+            search_text,
+            "DESC" if sort_desc else "ASC",
+            on_done=lambda future: self._apply_clips(
+                future, search_text, sort_desc, force
+            ),
+        )
+
+    def _apply_clips(
+        self,
+        future: Future,
+        search_text: Optional[str],
+        sort_desc: bool,
+        force: bool,
+    ) -> None:
+        """Show the result of a ``_refresh_data`` query."""
+        self._refresh_pending = False
+        if self._refresh_queued is not None:
+            # Search or sort changed while querying; this result is stale
+            force = force or self._refresh_queued
+            self._refresh_queued = None
+            self._refresh_data(force=force)
+            return
+
+        try:
+            clips = future.result()
+        except Exception as exc:
+            self.status_label.configure(text=f"Could not load snippets: {exc}")
+            return
+
+        if search_text is None:
+            self._loaded_clips = clips
+            self._prefix_index = None
+        self._show_clips(clips, search_text, sort_desc, force)
+
+    def _show_clips(
+        self,
+        clips: List[ClipItem],
+        search_text: Optional[str],
+        sort_desc: bool,
+        force: bool,
+    ) -> None:
+        """Group clips by day and show them, unless the list already does."""
         new_ids = [item.id for item in clips]
 
         # Avoid rebuilding UI (and flashing) if data didn't change
@@ -660,7 +1324,7 @@ class CopyHistoryApp(tk.Tk):
             not force
             and new_ids == self._last_clip_ids
             and search_text == self._last_search_text
-            and self.sort_desc == self._last_sort_desc
+            and sort_desc == self._last_sort_desc
         ):
             self.status_label.configure(
                 text=f"Showing {len(clips)} item(s)"
@@ -670,108 +1334,55 @@ class CopyHistoryApp(tk.Tk):
 
         self._last_clip_ids = new_ids
         self._last_search_text = search_text
-        self._last_sort_desc = self.sort_desc
-
-        self._clear_cards()
-        current_date_label: Optional[str] = None
-        row_index = 0
+        self._last_sort_desc = sort_desc
 
-        # Sort items by local datetime according to current sort order
-        def sort_key(clip: ClipItem) -> datetime:
-            ts = (clip.created_at or "").strip()
-            try:
-                if ts.endswith("Z"):
-                    ts = ts.replace("Z", "+00:00")
-                dt_utc = datetime.fromisoformat(ts)
-                return dt_utc.astimezone()
-            except Exception:
-                return datetime.min
-
-        clips_sorted = sorted(clips, key=sort_key, reverse=self.sort_desc)
-
-        for item in clips_sorted:
-            # Group by local calendar date
-            date_str = self._local_date_str(item.created_at)
-            if date_str != current_date_label:
-                header = ttk.Label(
-                    self.snippet_scroll,
-                    text=f"▼ {date_str}",
-                    style="DayHeader.TLabel",
-                )
-                header.grid(
-                    row=row_index,
-                    column=0,
-                    sticky="w",
-                    padx=8,
-                    pady=(8, 2),
-                )
-                self.day_groups[date_str] = {
-                    "header": header,
-                    "cards": [],
-                    "expanded": True,
-                }
-                header.bind(
-                    "<Button-1>",
-                    lambda event, d=date_str: self._toggle_day_group(d),
-                )
-                current_date_label = date_str
-                row_index += 1
-
-            preview = item.content.replace("\n", " ")
+        # Group by local calendar date; widgets are only built for visible rows
+        self.day_groups.clear()
+        for item in clips:
+            date_str = item.local_date_str
+            group = self.day_groups.get(date_str)
+            if group is None:
+                group = {"items": [], "expanded": True}
+                self.day_groups[date_str] = group
+
+            # fetch_clips already flattened and cut the preview in SQL
+            preview = item.preview or ""
             if len(preview) > 90:
                 preview = preview[:87] + "..."
+            group["items"].append((item, preview))
 
-            card = SnippetCard(
-                self.snippet_scroll,
-                item=item,
-                preview_text=preview,
-                on_select=self._on_card_selected,
-                on_copy=self._copy_item_to_clipboard,
-                on_details=self._show_item_details,
-            )
-
-            card.grid(
-                row=row_index,
-                column=0,
-                sticky="ew",
-                padx=10,
-                pady=(4, 6),
-            )
-            self.cards.append(card)
-            self.day_groups[date_str]["cards"].append(card)
-            row_index += 1
-
-        # Update visual selection state on cards
-        for card in self.cards:
-            card.set_selected(card.item_id == self.last_selected_id)
+        self._show_day_groups()
 
         self.status_label.configure(
             text=f"Showing {len(clips)} item(s)"
             + (f" for search '{search_text}'" if search_text else "")
         )
 
+    def _show_day_groups(self) -> None:
+        """Flatten day groups into list rows, skipping collapsed days' cards."""
+        rows: List[tuple[str, Hashable, tuple]] = []
+        for date_str, group in self.day_groups.items():
+            rows.append(("header", date_str, (date_str, group["expanded"])))
+            if group["expanded"]:
+                rows.extend(
+                    ("card", entry[0].id, entry) for entry in group["items"]
+                )
+        self.snippet_list.set_rows(rows)
+
     def _toggle_day_group(self, date_str: str) -> None:
         """Toggle expand/collapse for a given date group."""
         group = self.day_groups.get(date_str)
         if not group:
             return
 
-        if group["expanded"]:
-            for card in group["cards"]:
-                card.grid_remove()
-            group["expanded"] = False
-            group["header"].configure(text=f"▶ {date_str}")
-        else:
-            for card in group["cards"]:
-                card.grid()
-            group["expanded"] = True
-            group["header"].configure(text=f"▼ {date_str}")
+        group["expanded"] = not group["expanded"]
+        self._show_day_groups()
 
     # ---------- card interaction ----------
 
     def _on_card_selected(self, item_id: int, card: SnippetCard) -> None:
         self.last_selected_id = item_id
-        for c in self.cards:
+        for c in self.snippet_list.widgets("card"):
             c.set_selected(c is card)
 
     # ---------- copy ----------
@@ -783,7 +1394,18 @@ class CopyHistoryApp(tk.Tk):
         self._copy_item_to_clipboard(self.last_selected_id)
 
     def _copy_item_to_clipboard(self, item_id: int) -> None:
-        item: Optional[ClipItem] = get_clip_by_id(item_id)
+        self._submit(
+            get_clip_by_id,
+            item_id,
+            on_done=lambda future: self._copy_loaded_item(future, item_id),
+        )
+
+    def _copy_loaded_item(self, future: Future, item_id: int) -> None:
+        try:
+            item: Optional[ClipItem] = future.result()
+        except Exception as exc:
+            messagebox.showerror("ClipVault", f"Could not load item {item_id}:\n{exc}")
+            return
         if not item:
             messagebox.showerror("ClipVault", f"Item with id {item_id} not found.")
             return
@@ -799,7 +1421,18 @@ class CopyHistoryApp(tk.Tk):
     # ---------- detail view ----------
 
     def _show_item_details(self, item_id: int) -> None:
-        item: Optional[ClipItem] = get_clip_by_id(item_id)
+        self._submit(
+            get_clip_by_id,
+            item_id,
+            on_done=lambda future: self._show_loaded_item(future, item_id),
+        )
+
+    def _show_loaded_item(self, future: Future, item_id: int) -> None:
+        try:
+            item: Optional[ClipItem] = future.result()
+        except Exception as exc:
+            messagebox.showerror("ClipVault", f"Could not load item {item_id}:\n{exc}")
+            return
         if not item:
             messagebox.showerror("ClipVault", f"Item with id {item_id} not found.")
             return
@@ -855,16 +1488,21 @@ class CopyHistoryApp(tk.Tk):
 
     def _ensure_tray_icon(self) -> None:
         """Create and start the system tray icon if not already running."""
+        if self.tray_icon is not None or self._tray_loading:
+            return
+
+        # Decode the icon off the Tk thread; the tray starts once it is ready
+        self._tray_loading = True
+        self._submit(_load_tray_image, on_done=self._start_tray_icon)
+
+    def _start_tray_icon(self, future: Future) -> None:
+        self._tray_loading = False
         if self.tray_icon is not None:
             return
 
-        # Try to load icon image for tray
-        try:
-            tray_image = Image.open(resource_path("icon.png"))
-        except Exception:
-            # Fallback: simple 16x16 blank image
-            tray_image = Image.new("RGBA", (16, 16), (0, 0, 0, 0))
+        import pystray
 
+        tray_image = future.result()
         menu = pystray.Menu(
             pystray.MenuItem("Show ClipVault", self._tray_show),
             pystray.MenuItem("Quit", self._tray_quit),
@@ -877,7 +1515,7 @@ class CopyHistoryApp(tk.Tk):
 
         threading.Thread(target=run_tray, daemon=True).start()
 
-    def _tray_show(self, icon: pystray.Icon, item) -> None:
+    def _tray_show(self, icon: "pystray.Icon", item) -> None:
         """Callback from tray icon to show the main window."""
         # Must interact with Tk on the main thread
         self.after(0, self._show_main_window)
@@ -891,7 +1529,7 @@ class CopyHistoryApp(tk.Tk):
         except Exception:
             pass
 
-    def _tray_quit(self, icon: pystray.Icon, item) -> None:
+    def _tray_quit(self, icon: "pystray.Icon", item) -> None:
         """Callback from tray icon to quit the app."""
         # Schedule quitting on Tk main thread
         self.after(0, self._quit_app)
@@ -908,6 +1546,8 @@ class CopyHistoryApp(tk.Tk):
         if self.monitor_thread.is_alive():
             self.monitor_thread.stop()
 
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
         # Release single-instance lock if owned
         if self._instance_lock is not None:
             try: